@@ -1,6 +1,5 @@
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import yfinance as yf
 from pathlib import Path  # NEW
 
 DATA_DIR = "Scripts and CSV Files"
@@ -9,37 +8,83 @@ PORTFOLIO_CSV = f"{DATA_DIR}/chatgpt_portfolio_update.csv"
 # Save path in project root
 RESULTS_PATH = Path("Results.png")  # NEW
 
+# Closes for finished date windows, so redrawing doesn't re-download them
+SP500_CACHE_DIR = Path(DATA_DIR) / ".cache"
+
+# Experiment start: both series are rebased to $100 on this close
+BASELINE_DATE = pd.Timestamp("2025-06-27")
+BASELINE_EQUITY = 100.0
+
+# Console summary filled straight from the dict main() returns
+SUMMARY_TEMPLATE = (
+    "Largest run: {largest_run_start:%Y-%m-%d} → {largest_run_end:%Y-%m-%d}, +{largest_run_gain_pct:.2f}%\n"
+    "Max drawdown: {max_drawdown_pct:.2f}% on {max_drawdown_date:%Y-%m-%d} (equity {max_drawdown_equity:.2f})"
+)
+
 
 def load_portfolio_totals() -> pd.DataFrame:
     """Load portfolio equity history including a baseline row."""
-    chatgpt_df = pd.read_csv(PORTFOLIO_CSV)
-    chatgpt_totals = chatgpt_df[chatgpt_df["Ticker"] == "TOTAL"].copy()
-    chatgpt_totals["Date"] = pd.to_datetime(chatgpt_totals["Date"])
-    chatgpt_totals["Total Equity"] = pd.to_numeric(
-        chatgpt_totals["Total Equity"], errors="coerce"
+    # Only three columns are used; Ticker repeats heavily, so as a category
+    # the TOTAL filter compares integer codes
+    chatgpt_df = pd.read_csv(
+        PORTFOLIO_CSV,
+        usecols=["Date", "Ticker", "Total Equity"],
+        dtype={"Ticker": "category"},
     )
-
-    baseline_date = pd.Timestamp("2025-06-27")
-    baseline_equity = 100.0
-    baseline_row = pd.DataFrame({"Date": [baseline_date], "Total Equity": [baseline_equity]})
-
-    out = pd.concat([baseline_row, chatgpt_totals], ignore_index=True).sort_values("Date")
-    out = out.drop_duplicates(subset=["Date"], keep="last").reset_index(drop=True)
-    return out
+    total_rows = chatgpt_df[chatgpt_df["Ticker"] == "TOTAL"]
+    # build the two typed columns directly instead of copying and overwriting
+    chatgpt_totals = pd.DataFrame({
+        "Date": pd.to_datetime(total_rows["Date"]),
+        "Total Equity": pd.to_numeric(total_rows["Total Equity"], errors="coerce"),
+    })
+
+    # sort and de-duplicate the CSV history once; the baseline is only added
+    # when the CSV has no row for that date, and a real row always wins
+    out = chatgpt_totals.sort_values("Date", kind="stable")
+    out = out.drop_duplicates(subset=["Date"], keep="last")
+    if not (out["Date"] == BASELINE_DATE).any():
+        baseline_row = pd.DataFrame({"Date": [BASELINE_DATE], "Total Equity": [BASELINE_EQUITY]})
+        out = pd.concat([baseline_row, out], ignore_index=True)
+        if not out["Date"].is_monotonic_increasing:
+            out = out.sort_values("Date", kind="stable")
+    return out.reset_index(drop=True)
 
 
 def download_sp500(start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataFrame:
     """Download S&P 500 prices and normalise to a $100 baseline (at 2025-06-27 close=6173.07)."""
-    sp500 = yf.download("^SPX", start=start_date, end=end_date + pd.Timedelta(days=1),
-                        progress=False, auto_adjust=True)
-    sp500 = sp500.reset_index()
-    if isinstance(sp500.columns, pd.MultiIndex):
-        sp500.columns = sp500.columns.get_level_values(0)
+    # a window ending before today is final, so it can be served from disk
+    cache_path = SP500_CACHE_DIR / f"spx_{start_date.date()}_{end_date.date()}.csv"
+    cacheable = end_date.normalize() < pd.Timestamp.today().normalize()
+    if cacheable and cache_path.exists():
+        sp500 = pd.read_csv(cache_path, parse_dates=["Date"])
+    else:
+        import yfinance as yf  # deferred so cached windows never load it
+
+        raw = yf.download("^SPX", start=start_date, end=end_date + pd.Timedelta(days=1),
+                          progress=False, auto_adjust=True)
+        # only Close is needed; take it straight off the date index rather
+        # than resetting the index of the whole OHLCV frame
+        close = raw["Close"]
+        if isinstance(close, pd.DataFrame):  # MultiIndex columns: one per ticker
+            close = close.iloc[:, 0]
+        sp500 = pd.DataFrame({"Date": raw.index, "Close": close.to_numpy()})
+        if cacheable and not sp500.empty:
+            SP500_CACHE_DIR.mkdir(exist_ok=True)
+            sp500.to_csv(cache_path, index=False)
 
     spx_27_price = 6173.07  # 2025-06-27 close (baseline)
     scaling_factor = 100.0 / spx_27_price
-    sp500["SPX Value ($100 Invested)"] = sp500["Close"] * scaling_factor
-    return sp500[["Date", "SPX Value ($100 Invested)"]]
+    return pd.DataFrame({
+        "Date": sp500["Date"],
+        "SPX Value ($100 Invested)": sp500["Close"] * scaling_factor,
+    })
+
+
+def _sorted_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df ordered by Date, skipping the sort when the loader already did it."""
+    if df["Date"].is_monotonic_increasing:
+        return df
+    return df.sort_values("Date")
 
 
 def find_largest_gain(df: pd.DataFrame) -> tuple[pd.Timestamp, pd.Timestamp, float]:
@@ -47,66 +92,48 @@ def find_largest_gain(df: pd.DataFrame) -> tuple[pd.Timestamp, pd.Timestamp, flo
     Largest rise from a local minimum to the subsequent peak.
     Returns (start_date, end_date, gain_pct).
     """
-    df = df.sort_values("Date")
-    min_val = float(df["Total Equity"].iloc[0])
-    min_date = pd.Timestamp(df["Date"].iloc[0])
-    peak_val = min_val
-    peak_date = min_date
-    best_gain = 0.0
-    best_start = min_date
-    best_end = peak_date
-
-    # iterate rows 1..end
-    for date, val in df[["Date", "Total Equity"]].iloc[1:].itertuples(index=False):
-        val = float(val)
-        date = pd.Timestamp(date)
-
-        # extend peak while rising
-        if val > peak_val:
-            peak_val = val
-            peak_date = date
-            continue
-
-        # fall → close previous run
-        if val < peak_val:
-            gain = (peak_val - min_val) / min_val * 100.0
-            if gain > best_gain:
-                best_gain = gain
-                best_start = min_date
-                best_end = peak_date
-            # reset min/peak at this valley
-            min_val = val
-            min_date = date
-            peak_val = val
-            peak_date = date
-
-    # final run (if last segment ends on a rise)
-    gain = (peak_val - min_val) / min_val * 100.0
-    if gain > best_gain:
-        best_gain = gain
-        best_start = min_date
-        best_end = peak_date
-
-    return best_start, best_end, best_gain
+    df = _sorted_by_date(df)
+    first_date = pd.Timestamp(df["Date"].iloc[0])
+
+    # rows without an equity value never start, extend or close a run
+    df = df.dropna(subset=["Total Equity"])
+    if df.empty:
+        return first_date, first_date, 0.0
+    values = df["Total Equity"].to_numpy(dtype=float)
+    dates = df["Date"].to_numpy()
+
+    # a run is a stretch with no fall; label runs by counting the falls so far
+    run_id = np.concatenate(([0], np.cumsum(values[1:] < values[:-1])))
+    run_start = np.flatnonzero(np.diff(run_id, prepend=-1))
+    # earliest date each run reaches its peak
+    run_peak = pd.Series(values).groupby(run_id).idxmax().to_numpy()
+
+    gains = (values[run_peak] - values[run_start]) / values[run_start] * 100.0
+    best = int(np.argmax(gains))
+    if not gains[best] > 0.0:
+        return first_date, first_date, 0.0
+    return pd.Timestamp(dates[run_start[best]]), pd.Timestamp(dates[run_peak[best]]), float(gains[best])
 
 
 def compute_drawdown(df: pd.DataFrame) -> tuple[pd.Timestamp, float, float]:
     """
     Compute running max and drawdown (%). Return (dd_date, dd_value, dd_pct).
     """
-    df = df.sort_values("Date").copy()
-    df["Running Max"] = df["Total Equity"].cummax()
-    df["Drawdown %"] = (df["Total Equity"] / df["Running Max"] - 1.0) * 100.0
-    row = df.loc[df["Drawdown %"].idxmin()]
-    return pd.Timestamp(row["Date"]), float(row["Total Equity"]), float(row["Drawdown %"])
+    df = _sorted_by_date(df)
+    equity = df["Total Equity"].to_numpy(dtype=float)
+    # fmax skips NaN the same way Series.cummax does
+    running_max = np.fmax.accumulate(equity)
+    drawdown_pct = (equity / running_max - 1.0) * 100.0
+    i = int(np.nanargmin(drawdown_pct))
+    return pd.Timestamp(df["Date"].iloc[i]), float(equity[i]), float(drawdown_pct[i])
 
 
 def main() -> dict:
     """Generate and display the comparison graph; return metrics."""
     chatgpt_totals = load_portfolio_totals()
 
-    start_date = pd.Timestamp("2025-06-27")
-    end_date = chatgpt_totals["Date"].max()
+    start_date = BASELINE_DATE
+    end_date = chatgpt_totals["Date"].iat[-1]  # loader returns rows sorted by date
     sp500 = download_sp500(start_date, end_date)
 
     # metrics
@@ -114,6 +141,8 @@ def main() -> dict:
     dd_date, dd_value, dd_pct = compute_drawdown(chatgpt_totals)
 
     # plotting
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(10, 6))
     plt.style.use("seaborn-v0_8-whitegrid")
 
@@ -136,9 +165,9 @@ def main() -> dict:
     )
 
     # annotate largest gain
-    largest_peak_value = float(
-        chatgpt_totals.loc[chatgpt_totals["Date"] == largest_end, "Total Equity"].iloc[0]
-    )
+    # dates are sorted and unique, so a binary search finds the peak row
+    peak_idx = int(chatgpt_totals["Date"].searchsorted(largest_end))
+    largest_peak_value = float(chatgpt_totals["Total Equity"].iat[peak_idx])
     plt.text(
         largest_end,
         largest_peak_value + 0.3,
@@ -200,11 +229,4 @@ if __name__ == "__main__":
     print("generating graph...")
 
     metrics = main()
-    ls = metrics["largest_run_start"].date()
-    le = metrics["largest_run_end"].date()
-    lg = metrics["largest_run_gain_pct"]
-    dd_d = metrics["max_drawdown_date"].date()
-    dd_e = metrics["max_drawdown_equity"]
-    dd_p = metrics["max_drawdown_pct"]
-    print(f"Largest run: {ls} → {le}, +{lg:.2f}%")
-    print(f"Max drawdown: {dd_p:.2f}% on {dd_d} (equity {dd_e:.2f})")
\ No newline at end of file
+    print(SUMMARY_TEMPLATE.format_map(metrics))
\ No newline at end of file
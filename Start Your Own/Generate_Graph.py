@@ -12,12 +12,11 @@ import argparse
 from pathlib import Path
 from typing import Optional, cast
 
-import matplotlib.pyplot as plt
 import pandas as pd
-import yfinance as yf
 
 DATA_DIR = Path(__file__).resolve().parent
 PORTFOLIO_CSV = DATA_DIR / "chatgpt_portfolio_update.csv"
+SP500_CACHE_DIR = DATA_DIR / ".cache"
 
 
 def parse_date(date_str: str, label: str) -> pd.Timestamp:
@@ -75,18 +74,28 @@ def load_portfolio_details(
     if not portfolio_csv.exists():
         raise SystemExit(f"Portfolio file '{portfolio_csv}' not found.")
 
-    df = pd.read_csv(portfolio_csv)
-    totals = df[df["Ticker"] == "TOTAL"].copy()
-    if totals.empty:
+    # Only three columns are used; Ticker repeats heavily, so as a category
+    # the TOTAL filter compares integer codes
+    df = pd.read_csv(
+        portfolio_csv,
+        usecols=["Date", "Ticker", "Total Equity"],
+        dtype={"Ticker": "category"},
+    )
+    total_rows = df[df["Ticker"] == "TOTAL"]
+    if total_rows.empty:
         raise SystemExit("""Portfolio CSV contains no TOTAL rows. Please run 'python trading_script.py --data-dir "Start Your Own"' at least once for graphing data.""")
 
-    totals["Date"] = pd.to_datetime(totals["Date"], errors="coerce")
-    totals["Total Equity"] = pd.to_numeric(totals["Total Equity"], errors="coerce")
+    # build the two typed columns directly instead of copying and overwriting
+    totals = pd.DataFrame({
+        "Date": pd.to_datetime(total_rows["Date"], errors="coerce"),
+        "Total Equity": pd.to_numeric(total_rows["Total Equity"], errors="coerce"),
+    })
 
     totals = totals.dropna(subset=["Date", "Total Equity"]).sort_values("Date")
 
-    min_date = totals["Date"].min()
-    max_date = totals["Date"].max()
+    # rows are sorted by date, so the ends are the extremes
+    min_date = totals["Date"].iat[0]
+    max_date = totals["Date"].iat[-1]
     if start_date is None or start_date < min_date:
         start_date = min_date
     if end_date is None or end_date > max_date:
@@ -100,34 +109,55 @@ def load_portfolio_details(
     return totals.loc[mask, ["Date", "Total Equity"]].reset_index(drop=True)
 
 
-def download_sp500(dates, starting_equity):
-    """
-    Download S&P 500 data and normalize to starting equity
-    """
-    if len(dates) == 0:
-        return pd.DataFrame()
-    
-    start_date = dates.min()
-    end_date = dates.max()
-    
+def _download_sp500_close(start_date: pd.Timestamp, end_date: pd.Timestamp) -> pd.DataFrame:
+    """Download ^GSPC closes as (Date, Value); empty on any failure."""
+    # yfinance is imported lazily so --help and CSV errors skip its startup cost
+    import yfinance as yf
+
     # Download S&P 500 data with error handling
     try:
         sp500 = yf.download("^GSPC", start=start_date, end=end_date + pd.Timedelta(days=1), progress=False)
     except Exception as e:
         print(f"Error downloading S&P 500 data: {e}")
         return pd.DataFrame()
-    
+
     # Check if download returned None or empty
     if sp500 is None or sp500.empty:
         return pd.DataFrame()
-    
+
     # Reset index to get Date as a column
     sp500 = sp500.reset_index()
-    
+
     # Extract only the 'Close' price series
     sp500_close = sp500[['Date', 'Close']].copy()
     sp500_close.columns = ['Date', 'Value']
+    return sp500_close
+
+
+def download_sp500(dates, starting_equity):
+    """
+    Download S&P 500 data and normalize to starting equity
+    """
+    if len(dates) == 0:
+        return pd.DataFrame()
     
+    start_date = dates.min()
+    end_date = dates.max()
+
+    # Closes for a window that has already ended never change, so those are
+    # kept on disk; a window reaching today is always downloaded fresh
+    cache_path = SP500_CACHE_DIR / f"sp500_{start_date.date()}_{end_date.date()}.csv"
+    cacheable = end_date.normalize() < pd.Timestamp.today().normalize()
+    if cacheable and cache_path.exists():
+        sp500_close = pd.read_csv(cache_path, parse_dates=["Date"])
+    else:
+        sp500_close = _download_sp500_close(start_date, end_date)
+        if sp500_close.empty:
+            return pd.DataFrame()
+        if cacheable:
+            SP500_CACHE_DIR.mkdir(exist_ok=True)
+            sp500_close.to_csv(cache_path, index=False)
+
     # Align with portfolio dates
     aligned_values = _align_to_dates(sp500_close, dates)
     
@@ -151,23 +181,25 @@ def plot_comparison(
     """
     Plot the two normalized lines. Expects:
       - portfolio: columns ['Date', 'Total Equity'] (already normalized if desired)
-      - spx:       columns ['Date', 'SPX Value'] (already normalized)
+      - spx:       columns ['Date', 'SPX Value'] (already normalized); empty to plot the portfolio alone
     """
+    import matplotlib.pyplot as plt
+
     plt.style.use("seaborn-v0_8-whitegrid")
     fig, ax = plt.subplots(figsize=(10, 6))
 
     ax.plot(portfolio["Date"], portfolio["Total Equity"], label=f"Portfolio (start={starting_equity:g})", marker="o")
-    ax.plot(spx["Date"], spx["SPX Value"], label="S&P 500", marker="o", linestyle="--")
-    
+
     # Annotate last points as percent vs baseline
     p_last = float(portfolio["Total Equity"].iloc[-1])
-    s_last = float(spx["SPX Value"].iloc[-1])
-
     p_pct = (p_last / starting_equity - 1.0) * 100.0
-    s_pct = (s_last / starting_equity - 1.0) * 100.0
-
     ax.text(portfolio["Date"].iloc[-1], p_last * 1.01, f"{p_pct:+.1f}%", fontsize=9)
-    ax.text(spx["Date"].iloc[-1], s_last * 1.01, f"{s_pct:+.1f}%", fontsize=9)
+
+    if not spx.empty:
+        ax.plot(spx["Date"], spx["SPX Value"], label="S&P 500", marker="o", linestyle="--")
+        s_last = float(spx["SPX Value"].iloc[-1])
+        s_pct = (s_last / starting_equity - 1.0) * 100.0
+        ax.text(spx["Date"].iloc[-1], s_last * 1.01, f"{s_pct:+.1f}%", fontsize=9)
 
     ax.set_title(title)
     ax.set_xlabel("Date")
@@ -184,24 +216,32 @@ def main(
     starting_equity: float,
     output: Optional[Path],
     portfolio_csv: Path = PORTFOLIO_CSV,
+    benchmark: bool = True,
 ) -> None:
     # Load portfolio totals in the date range
     totals = load_portfolio_details(start_date, end_date, portfolio_csv=portfolio_csv)
 
-    # Normalize portfolio to the chosen starting equity
-    norm_port = totals.copy()
-    norm_port["Total Equity"] = _normalize_to_start(norm_port["Total Equity"], starting_equity)
+    # Normalize portfolio to the chosen starting equity; totals is our own
+    # freshly loaded frame, so it is updated in place rather than copied
+    totals["Total Equity"] = _normalize_to_start(totals["Total Equity"], starting_equity)
 
-    # Download & normalize S&P to same baseline, aligned to portfolio dates
-    spx = download_sp500(norm_port["Date"], starting_equity)
+    # Download & normalize S&P to same baseline, aligned to portfolio dates;
+    # --no-benchmark skips the network fetch, and a failed fetch degrades the same way
+    spx = download_sp500(totals["Date"], starting_equity) if benchmark else pd.DataFrame()
+    if benchmark and spx.empty:
+        print("S&P 500 data unavailable; plotting the portfolio without a benchmark.")
 
     # Plot
-    plot_comparison(norm_port, spx, starting_equity, title="ChatGPT Portfolio vs. S&P 500 (Indexed)")
+    title = "ChatGPT Portfolio vs. S&P 500 (Indexed)" if not spx.empty else "ChatGPT Portfolio (Indexed)"
+    plot_comparison(totals, spx, starting_equity, title=title)
 
     # Save or show
+    import matplotlib.pyplot as plt
+
     if output:
         output = output if output.is_absolute() else DATA_DIR / output
-        plt.savefig(output, bbox_inches="tight")
+        # plot_comparison already ran tight_layout; a tight bbox would lay out again
+        plt.savefig(output)
     else:
         plt.show()
     plt.close()
@@ -214,6 +254,7 @@ if __name__ == "__main__":
     parser.add_argument("--start-equity", type=float, default=100.0, help="Baseline to index both series (default 100)")
     parser.add_argument("--baseline-file", type=str, help="Path to a text file containing a single number for baseline")
     parser.add_argument("--output", type=str, help="Optional path to save the chart (.png/.jpg/.pdf)")
+    parser.add_argument("--no-benchmark", action="store_true", help="Skip downloading and plotting the S&P 500")
 
     args = parser.parse_args()
     start = parse_date(args.start_date, "start date") if args.start_date else None
@@ -230,4 +271,4 @@ if __name__ == "__main__":
             raise SystemExit(f"Could not parse baseline from {p}") from exc
 
     out_path = Path(args.output) if args.output else None
-    main(start, end, baseline, out_path)
\ No newline at end of file
+    main(start, end, baseline, out_path, benchmark=not args.no_benchmark)
\ No newline at end of file
@@ -19,7 +19,7 @@ import pandas as pd
 # Import existing trading functions
 from trading_script import (
     process_portfolio, daily_results, load_latest_portfolio_state,
-    set_data_dir, PORTFOLIO_CSV, TRADE_LOG_CSV, last_trading_date
+    set_data_dir, PORTFOLIO_CSV, TRADE_LOG_CSV, PORTFOLIO_COLUMNS, last_trading_date
 )
 
 try:
@@ -29,6 +29,39 @@ except ImportError:
     HAS_OPENAI = False
 
 
+# Outermost {...} span in an LLM reply, compiled once rather than per response
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Static prompt text, kept as plain module constants so only the portfolio
+# details are formatted per call
+SYSTEM_PROMPT = "You are a professional portfolio analyst. Always respond with valid JSON in the exact format requested."
+
+PROMPT_INSTRUCTIONS = """- Prefer U.S. micro-cap stocks (<$300M market cap)
+- Full shares only, no options or derivatives
+- Use stop-losses for risk management
+- Be conservative with position sizing
+
+Analyze the current market conditions and provide specific trading recommendations.
+
+Respond with ONLY a JSON object in this exact format:
+{
+    "analysis": "Brief market analysis",
+    "trades": [
+        {
+            "action": "buy",
+            "ticker": "SYMBOL",
+            "shares": 100,
+            "price": 25.50,
+            "stop_loss": 20.00,
+            "reason": "Brief rationale"
+        }
+    ],
+    "confidence": 0.8
+}
+
+Only recommend trades you are confident about. If no trades are recommended, use an empty trades array."""
+
+
 def generate_trading_prompt(portfolio_df: pd.DataFrame, cash: float, total_equity: float) -> str:
     """Generate a trading prompt with current portfolio data"""
     
@@ -52,30 +85,7 @@ Total Equity: ${total_equity:,.2f}
 
 Rules:
 - You have ${cash:,.2f} in cash available for new positions
-- Prefer U.S. micro-cap stocks (<$300M market cap)
-- Full shares only, no options or derivatives
-- Use stop-losses for risk management
-- Be conservative with position sizing
-
-Analyze the current market conditions and provide specific trading recommendations.
-
-Respond with ONLY a JSON object in this exact format:
-{{
-    "analysis": "Brief market analysis",
-    "trades": [
-        {{
-            "action": "buy",
-            "ticker": "SYMBOL",
-            "shares": 100,
-            "price": 25.50,
-            "stop_loss": 20.00,
-            "reason": "Brief rationale"
-        }}
-    ],
-    "confidence": 0.8
-}}
-
-Only recommend trades you are confident about. If no trades are recommended, use an empty trades array."""
+{PROMPT_INSTRUCTIONS}"""
     
     return prompt
 
@@ -91,7 +101,7 @@ def call_openai_api(prompt: str, api_key: str, model: str = "gpt-4") -> str:
         response = client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": "You are a professional portfolio analyst. Always respond with valid JSON in the exact format requested."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.3,
@@ -106,7 +116,7 @@ def parse_llm_response(response: str) -> Dict[str, Any]:
     """Parse LLM response and extract trading decisions"""
     try:
         # Try to extract JSON from response
-        json_match = re.search(r'\{.*\}', response, re.DOTALL)
+        json_match = _JSON_OBJECT_RE.search(response)
         if json_match:
             json_str = json_match.group()
             return json.loads(json_str)
@@ -179,7 +189,7 @@ def run_automated_trading(api_key: str, model: str = "gpt-4", data_dir: str = "S
     if portfolio_file.exists():
         portfolio_df, cash = load_latest_portfolio_state()
     else:
-        portfolio_df = pd.DataFrame(columns=["ticker", "shares", "stop_loss", "buy_price", "cost_basis"])
+        portfolio_df = pd.DataFrame(columns=PORTFOLIO_COLUMNS)
         cash = 10000.0  # Default starting cash
     
     # Calculate total equity (simplified)
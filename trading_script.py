@@ -25,7 +25,6 @@ import warnings
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 import json
 import logging
 
@@ -206,6 +205,10 @@ STOOQ_MAP = {
 # Symbols we should *not* attempt on Stooq
 STOOQ_BLOCKLIST = {"^RUT"}
 
+# Column layouts shared by every holdings frame and every price frame
+PORTFOLIO_COLUMNS = ["ticker", "shares", "stop_loss", "buy_price", "cost_basis"]
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
+
 
 # ------------------------------
 # Data access layer (UPDATED)
@@ -225,19 +228,18 @@ def _to_datetime_index(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    # Callers pass frames fresh from a download (already relabelled in place by
+    # _to_datetime_index), so columns are relabelled in place too; no copy needed.
     # Flatten multiIndex frame so we can lazily lookup values by index.
     if isinstance(df.columns, pd.MultiIndex):
         try:
             # If the second level is the same ticker for all cols, drop it
             if len(set(df.columns.get_level_values(1))) == 1:
-                df = df.copy()
                 df.columns = df.columns.get_level_values(0)
             else:
                 # multiple tickers: flatten with join
-                df = df.copy()
                 df.columns = ["_".join(map(str, t)).strip("_") for t in df.columns.to_flat_index()]
         except Exception:
-            df = df.copy()
             df.columns = ["_".join(map(str, t)).strip("_") for t in df.columns.to_flat_index()]
             
     # Ensure all expected columns exist
@@ -246,13 +248,13 @@ def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
             df[c] = np.nan
     if "Adj Close" not in df.columns:
         df["Adj Close"] = df["Close"]
-    cols = ["Open", "High", "Low", "Close", "Adj Close", "Volume"]
-    return df[cols]
+    return df[OHLCV_COLUMNS]
 
 def _yahoo_download(ticker: str, **kwargs: Any) -> pd.DataFrame:
     """Call yfinance.download with a real UA and silence all chatter."""
     import io, logging
     from contextlib import redirect_stderr, redirect_stdout
+    import yfinance as yf  # deferred: only paid for when a Yahoo fetch actually runs
 
     kwargs.setdefault("progress", False)
     kwargs.setdefault("threads", False)
@@ -268,9 +270,20 @@ def _yahoo_download(ticker: str, **kwargs: Any) -> pd.DataFrame:
             return pd.DataFrame()
     return df if isinstance(df, pd.DataFrame) else pd.DataFrame()
 
+_STOOQ_SESSION: Any = None
+
+
+def _stooq_session() -> Any:
+    """Return one shared requests.Session so fallback fetches reuse the TLS connection."""
+    global _STOOQ_SESSION
+    if _STOOQ_SESSION is None:
+        import requests
+        _STOOQ_SESSION = requests.Session()
+    return _STOOQ_SESSION
+
 def _stooq_csv_download(ticker: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
     """Fetch OHLCV from Stooq CSV endpoint (daily). Good for US tickers and many ETFs."""
-    import requests, io
+    import io
     if ticker in STOOQ_BLOCKLIST:
         return pd.DataFrame()
     t = STOOQ_MAP.get(ticker, ticker)
@@ -285,7 +298,7 @@ def _stooq_csv_download(ticker: str, start: pd.Timestamp, end: pd.Timestamp) ->
 
     url = f"https://stooq.com/q/d/l/?s={sym}&i=d"
     try:
-        r = requests.get(url, timeout=10)
+        r = _stooq_session().get(url, timeout=10)
         if r.status_code != 200 or not r.text.strip():
             return pd.DataFrame()
         df = pd.read_csv(io.StringIO(r.text))
@@ -302,7 +315,7 @@ def _stooq_csv_download(ticker: str, start: pd.Timestamp, end: pd.Timestamp) ->
         # Normalize to Yahoo-like schema
         if "Adj Close" not in df.columns:
             df["Adj Close"] = df["Close"]
-        return df[["Open", "High", "Low", "Close", "Adj Close", "Volume"]]
+        return df[OHLCV_COLUMNS]
     except Exception:
         return pd.DataFrame()
 
@@ -398,10 +411,28 @@ def download_price_data(ticker: str, **kwargs: Any) -> FetchResult:
             return FetchResult(_normalize_ohlcv(_to_datetime_index(df_proxy)), f"yahoo:{proxy}-proxy")
 
     # ---------- Nothing worked ----------
-    empty = pd.DataFrame(columns=["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+    empty = pd.DataFrame(columns=OHLCV_COLUMNS)
     return FetchResult(empty, "empty")
 
 
+# Last-trading-day fetches keyed by (ticker, window start). Manual trades and the
+# daily pricing pass ask for the same window, so one download serves both.
+_TRADING_DAY_CACHE: dict[tuple[str, pd.Timestamp], FetchResult] = {}
+
+def fetch_trading_day(ticker: str) -> FetchResult:
+    """Return OHLCV for the last trading day, reusing an earlier fetch from this run."""
+    s, e = trading_day_window()
+    key = (ticker.upper(), s)
+    cached = _TRADING_DAY_CACHE.get(key)
+    if cached is not None:
+        return cached
+    fetch = download_price_data(ticker, start=s, end=e, auto_adjust=False, progress=False)
+    # Don't remember misses so a later call can retry the fallbacks
+    if not fetch.df.empty:
+        _TRADING_DAY_CACHE[key] = fetch
+    return fetch
+
+
 
 # ------------------------------
 # File path configuration
@@ -418,6 +449,29 @@ def set_data_dir(data_dir: Path) -> None:
     logger.info("Data directory configured - Portfolio CSV: %s, Trade Log CSV: %s", PORTFOLIO_CSV, TRADE_LOG_CSV)
 
 
+# Last parse of each CSV, keyed by path and stamped with (mtime_ns, size)
+_CSV_CACHE: dict[str, tuple[tuple[int, int], pd.DataFrame]] = {}
+
+def _read_csv_cached(path: Path) -> pd.DataFrame:
+    """pd.read_csv that reuses the previous parse while the file is unchanged.
+
+    A run reads the portfolio CSV up to three times; only the reads after a
+    write actually re-parse. Callers get a copy so they may mutate freely.
+    """
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CSV_CACHE.get(str(path))
+    if cached is not None and cached[0] == stamp:
+        logger.info("Using cached CSV file: %s", path)
+        return cached[1].copy()
+
+    logger.info("Reading CSV file: %s", path)
+    df = pd.read_csv(path)
+    logger.info("Successfully read CSV file: %s", path)
+    _CSV_CACHE[str(path)] = (stamp, df)
+    return df.copy()
+
+
 # ------------------------------
 # Portfolio operations
 # ------------------------------
@@ -430,10 +484,18 @@ def _ensure_df(portfolio: pd.DataFrame | dict[str, list[object]] | list[dict[str
         # Ensure proper columns exist even for empty DataFrames
         if df.empty:
             logger.debug("Creating empty portfolio DataFrame with proper column structure")
-            df = pd.DataFrame(columns=["ticker", "shares", "stop_loss", "buy_price", "cost_basis"])
+            df = pd.DataFrame(columns=PORTFOLIO_COLUMNS)
         return df
     raise TypeError("portfolio must be a DataFrame, dict, or list[dict]")
 
+def _append_position(portfolio: pd.DataFrame, position: dict[str, object]) -> pd.DataFrame:
+    """Add one new holding row in place instead of concatenating a one-row frame."""
+    if portfolio.empty:
+        return pd.DataFrame([position])
+    # Labels can have gaps after sells, so take the next one past the max
+    portfolio.loc[int(portfolio.index.max()) + 1] = pd.Series(position)
+    return portfolio
+
 def process_portfolio(
     portfolio: pd.DataFrame | dict[str, list[object]] | list[dict[str, object]],
     cash: float,
@@ -476,8 +538,7 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
                         print("Invalid stop loss. Buy cancelled.")
                         continue
 
-                    s, e = trading_day_window()
-                    fetch = download_price_data(ticker, start=s, end=e, auto_adjust=False, progress=False)
+                    fetch = fetch_trading_day(ticker)
                     data = fetch.df
                     if data.empty:
                         print(f"MOO buy for {ticker} failed: no market data available (source={fetch.source}).")
@@ -500,19 +561,7 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
                         "Reason": "MANUAL BUY MOO - Filled",
                     }
                     # --- Manual BUY MOO logging ---
-                    if os.path.exists(TRADE_LOG_CSV):
-                        logger.info("Reading CSV file: %s", TRADE_LOG_CSV)
-                        df_log = pd.read_csv(TRADE_LOG_CSV)
-                        logger.info("Successfully read CSV file: %s", TRADE_LOG_CSV)
-                        if df_log.empty:
-                            df_log = pd.DataFrame([log])
-                        else:
-                            df_log = pd.concat([df_log, pd.DataFrame([log])], ignore_index=True)
-                    else:
-                        df_log = pd.DataFrame([log])
-                    logger.info("Writing CSV file: %s", TRADE_LOG_CSV)
-                    df_log.to_csv(TRADE_LOG_CSV, index=False)
-                    logger.info("Successfully wrote CSV file: %s", TRADE_LOG_CSV)
+                    _append_trade_log(log)
 
                     rows = portfolio_df.loc[portfolio_df["ticker"].astype(str).str.upper() == ticker.upper()]
                     if rows.empty:
@@ -523,10 +572,7 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
                             "buy_price": float(exec_price),
                             "cost_basis": float(notional),
                         }
-                        if portfolio_df.empty:
-                            portfolio_df = pd.DataFrame([new_trade])
-                        else:
-                            portfolio_df = pd.concat([portfolio_df, pd.DataFrame([new_trade])], ignore_index=True)
+                        portfolio_df = _append_position(portfolio_df, new_trade)
                     else:
                         idx = rows.index[0]
                         cur_shares = float(portfolio_df.at[idx, "shares"])
@@ -554,7 +600,7 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
                         continue
 
                     cash, portfolio_df = log_manual_buy(
-                        buy_price, shares, ticker, stop_loss, cash, portfolio_df
+                        buy_price, shares, ticker, stop_loss, cash, portfolio_df, today=today_iso
                     )
                     continue
                 else:
@@ -573,22 +619,25 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
                     continue
 
                 cash, portfolio_df = log_manual_sell(
-                    sell_price, shares, ticker, cash, portfolio_df
+                    sell_price, shares, ticker, cash, portfolio_df, today=today_iso
                 )
                 continue
 
             break  # proceed to pricing
 
     # ------- Daily pricing + stop-loss execution -------
-    s, e = trading_day_window()
-    for _, stock in portfolio_df.iterrows():
-        ticker = str(stock["ticker"]).upper()
-        shares = int(stock["shares"]) if not pd.isna(stock["shares"]) else 0
-        cost = float(stock["buy_price"]) if not pd.isna(stock["buy_price"]) else 0.0
-        cost_basis = float(stock["cost_basis"]) if not pd.isna(stock["cost_basis"]) else cost * shares
-        stop = float(stock["stop_loss"]) if not pd.isna(stock["stop_loss"]) else 0.0
-
-        fetch = download_price_data(ticker, start=s, end=e, auto_adjust=False, progress=False)
+    # Coerce the holdings columns once up front instead of per row
+    positions = portfolio_df.reindex(columns=PORTFOLIO_COLUMNS)
+    tickers = positions["ticker"].astype(str).str.upper()
+    share_counts = pd.to_numeric(positions["shares"]).fillna(0).astype(int)
+    buy_prices = pd.to_numeric(positions["buy_price"]).fillna(0.0)
+    cost_bases = pd.to_numeric(positions["cost_basis"]).fillna(buy_prices * share_counts)
+    stops = pd.to_numeric(positions["stop_loss"]).fillna(0.0)
+
+    for ticker, shares, cost, cost_basis, stop in zip(
+        tickers.tolist(), share_counts.tolist(), buy_prices.tolist(), cost_bases.tolist(), stops.tolist()
+    ):
+        fetch = fetch_trading_day(ticker)
         data = fetch.df
 
         if data.empty:
@@ -615,7 +664,7 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
             pnl = round((exec_price - cost) * shares, 2)
             action = "SELL - Stop Loss Triggered"
             cash += value
-            portfolio_df = log_sell(ticker, shares, exec_price, cost, pnl, portfolio_df)
+            portfolio_df = log_sell(ticker, shares, exec_price, cost, pnl, portfolio_df, today=today_iso)
             row = {
                 "Date": today_iso, "Ticker": ticker, "Shares": shares,
                 "Buy Price": cost, "Cost Basis": cost_basis, "Stop Loss": stop,
@@ -649,14 +698,18 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
 
     df_out = pd.DataFrame(results)
     if PORTFOLIO_CSV.exists():
-        logger.info("Reading CSV file: %s", PORTFOLIO_CSV)
-        existing = pd.read_csv(PORTFOLIO_CSV)
-        logger.info("Successfully read CSV file: %s", PORTFOLIO_CSV)
-        existing = existing[existing["Date"] != str(today_iso)]
+        existing = _read_csv_cached(PORTFOLIO_CSV)
+        keep = existing["Date"] != str(today_iso)
         print("Saving results to CSV...")
-        df_out = pd.concat([existing, df_out], ignore_index=True)
+        if keep.all() and set(df_out.columns).issubset(existing.columns):
+            # First run today: append the new rows rather than rewriting the history
+            _append_csv_rows(PORTFOLIO_CSV, df_out, list(existing.columns))
+            _CSV_CACHE.pop(str(PORTFOLIO_CSV), None)
+            return portfolio_df, cash
+        df_out = pd.concat([existing[keep], df_out], ignore_index=True)
     logger.info("Writing CSV file: %s", PORTFOLIO_CSV)
     df_out.to_csv(PORTFOLIO_CSV, index=False)
+    _CSV_CACHE.pop(str(PORTFOLIO_CSV), None)  # don't trust mtime granularity after our own write
     logger.info("Successfully wrote CSV file: %s", PORTFOLIO_CSV)
 
     return portfolio_df, cash
@@ -667,6 +720,48 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
 # Trade logging
 # ------------------------------
 
+def _append_csv_rows(path: Path, df: pd.DataFrame, header: list[str]) -> None:
+    """Append df to an existing CSV in its header's column order, leaving earlier rows untouched."""
+    logger.info("Appending to CSV file: %s", path)
+    with path.open("rb") as fh:
+        fh.seek(-1, os.SEEK_END)
+        needs_newline = fh.read(1) != b"\n"
+    with path.open("a", newline="", encoding="utf-8") as fh:
+        if needs_newline:
+            fh.write("\n")
+        df.reindex(columns=header).to_csv(fh, header=False, index=False)
+    logger.info("Successfully appended to CSV file: %s", path)
+
+
+def _append_trade_log(log: dict[str, object]) -> None:
+    """Append a single trade row to TRADE_LOG_CSV.
+
+    The row is written in the existing header's column order without
+    re-reading the whole log. If the file is missing or empty, or the row
+    carries a column the header doesn't have, the log is rewritten instead.
+    """
+    header: list[str] = []
+    if TRADE_LOG_CSV.exists():
+        try:
+            header = list(pd.read_csv(TRADE_LOG_CSV, nrows=0).columns)
+        except pd.errors.EmptyDataError:
+            header = []
+
+    if header and set(log).issubset(header):
+        _append_csv_rows(TRADE_LOG_CSV, pd.DataFrame([log]), header)
+        return
+
+    df = pd.DataFrame([log])
+    if header:
+        logger.info("Reading CSV file: %s", TRADE_LOG_CSV)
+        existing = pd.read_csv(TRADE_LOG_CSV)
+        logger.info("Successfully read CSV file: %s", TRADE_LOG_CSV)
+        if not existing.empty:
+            df = pd.concat([existing, df], ignore_index=True)
+    logger.info("Writing CSV file: %s", TRADE_LOG_CSV)
+    df.to_csv(TRADE_LOG_CSV, index=False)
+    logger.info("Successfully wrote CSV file: %s", TRADE_LOG_CSV)
+
 def log_sell(
     ticker: str,
     shares: float,
@@ -674,8 +769,9 @@ def log_sell(
     cost: float,
     pnl: float,
     portfolio: pd.DataFrame,
+    today: str | None = None,
 ) -> pd.DataFrame:
-    today = check_weekend()
+    today = today or check_weekend()
     log = {
         "Date": today,
         "Ticker": ticker,
@@ -688,19 +784,7 @@ def log_sell(
     print(f"{ticker} stop loss was met. Selling all shares.")
     portfolio = portfolio[portfolio["ticker"] != ticker]
 
-    if TRADE_LOG_CSV.exists():
-        logger.info("Reading CSV file: %s", TRADE_LOG_CSV)
-        df = pd.read_csv(TRADE_LOG_CSV)
-        logger.info("Successfully read CSV file: %s", TRADE_LOG_CSV)
-        if df.empty:
-            df = pd.DataFrame([log])
-        else:
-            df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
-    else:
-        df = pd.DataFrame([log])
-    logger.info("Writing CSV file: %s", TRADE_LOG_CSV)
-    df.to_csv(TRADE_LOG_CSV, index=False)
-    logger.info("Successfully wrote CSV file: %s", TRADE_LOG_CSV)
+    _append_trade_log(log)
     return portfolio
 
 def log_manual_buy(
@@ -711,8 +795,9 @@ def log_manual_buy(
     cash: float,
     chatgpt_portfolio: pd.DataFrame,
     interactive: bool = True,
+    today: str | None = None,
 ) -> tuple[float, pd.DataFrame]:
-    today = check_weekend()
+    today = today or check_weekend()
 
     if interactive:
         check = input(
@@ -724,12 +809,9 @@ def log_manual_buy(
             return cash, chatgpt_portfolio
 
     if not isinstance(chatgpt_portfolio, pd.DataFrame) or chatgpt_portfolio.empty:
-        chatgpt_portfolio = pd.DataFrame(
-            columns=["ticker", "shares", "stop_loss", "buy_price", "cost_basis"]
-        )
+        chatgpt_portfolio = pd.DataFrame(columns=PORTFOLIO_COLUMNS)
 
-    s, e = trading_day_window()
-    fetch = download_price_data(ticker, start=s, end=e, auto_adjust=False, progress=False)
+    fetch = fetch_trading_day(ticker)
     data = fetch.df
     if data.empty:
         print(f"Manual buy for {ticker} failed: no market data available (source={fetch.source}).")
@@ -763,41 +845,17 @@ def log_manual_buy(
         "PnL": 0.0,
         "Reason": "MANUAL BUY LIMIT - Filled",
     }
-    if os.path.exists(TRADE_LOG_CSV):
-        logger.info("Reading CSV file: %s", TRADE_LOG_CSV)
-        df = pd.read_csv(TRADE_LOG_CSV)
-        logger.info("Successfully read CSV file: %s", TRADE_LOG_CSV)
-        if df.empty:
-            df = pd.DataFrame([log])
-        else:
-            df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
-    else:
-        df = pd.DataFrame([log])
-    logger.info("Writing CSV file: %s", TRADE_LOG_CSV)
-    df.to_csv(TRADE_LOG_CSV, index=False)
-    logger.info("Successfully wrote CSV file: %s", TRADE_LOG_CSV)
+    _append_trade_log(log)
 
     rows = chatgpt_portfolio.loc[chatgpt_portfolio["ticker"].str.upper() == ticker.upper()]
     if rows.empty:
-        if chatgpt_portfolio.empty:
-            chatgpt_portfolio = pd.DataFrame([{
-                "ticker": ticker,
-                "shares": float(shares),
-                "stop_loss": float(stoploss),
-                "buy_price": float(exec_price),
-                "cost_basis": float(cost_amt),
-            }])
-        else:
-            chatgpt_portfolio = pd.concat(
-                [chatgpt_portfolio, pd.DataFrame([{
-                    "ticker": ticker,
-                    "shares": float(shares),
-                    "stop_loss": float(stoploss),
-                    "buy_price": float(exec_price),
-                    "cost_basis": float(cost_amt),
-                }])],
-                ignore_index=True
-            )
+        chatgpt_portfolio = _append_position(chatgpt_portfolio, {
+            "ticker": ticker,
+            "shares": float(shares),
+            "stop_loss": float(stoploss),
+            "buy_price": float(exec_price),
+            "cost_basis": float(cost_amt),
+        })
     else:
         idx = rows.index[0]
         cur_shares = float(chatgpt_portfolio.at[idx, "shares"])
@@ -821,8 +879,9 @@ def log_manual_sell(
     chatgpt_portfolio: pd.DataFrame,
     reason: str | None = None,
     interactive: bool = True,
+    today: str | None = None,
 ) -> tuple[float, pd.DataFrame]:
-    today = check_weekend()
+    today = today or check_weekend()
     if interactive:
         reason = input(
             f"""You are placing a SELL LIMIT for {shares_sold} {ticker} at ${sell_price:.2f}.
@@ -834,18 +893,18 @@ If this is a mistake, enter 1, or hit Enter."""
     elif reason is None:
         reason = ""
 
-    if ticker not in chatgpt_portfolio["ticker"].values:
+    held_mask = (chatgpt_portfolio["ticker"] == ticker).to_numpy()
+    if not held_mask.any():
         print(f"Manual sell for {ticker} failed: ticker not in portfolio.")
         return cash, chatgpt_portfolio
 
-    ticker_row = chatgpt_portfolio[chatgpt_portfolio["ticker"] == ticker]
+    ticker_row = chatgpt_portfolio[held_mask]
     total_shares = int(ticker_row["shares"].item())
     if shares_sold > total_shares:
         print(f"Manual sell for {ticker} failed: trying to sell {shares_sold} shares but only own {total_shares}.")
         return cash, chatgpt_portfolio
 
-    s, e = trading_day_window()
-    fetch = download_price_data(ticker, start=s, end=e, auto_adjust=False, progress=False)
+    fetch = fetch_trading_day(ticker)
     data = fetch.df
     if data.empty:
         print(f"Manual sell for {ticker} failed: no market data available (source={fetch.source}).")
@@ -876,23 +935,11 @@ If this is a mistake, enter 1, or hit Enter."""
         "Reason": f"MANUAL SELL LIMIT - {reason}", "Shares Sold": shares_sold,
         "Sell Price": exec_price,
     }
-    if os.path.exists(TRADE_LOG_CSV):
-        logger.info("Reading CSV file: %s", TRADE_LOG_CSV)
-        df = pd.read_csv(TRADE_LOG_CSV)
-        logger.info("Successfully read CSV file: %s", TRADE_LOG_CSV)
-        if df.empty:
-            df = pd.DataFrame([log])
-        else:
-            df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
-    else:
-        df = pd.DataFrame([log])
-    logger.info("Writing CSV file: %s", TRADE_LOG_CSV)
-    df.to_csv(TRADE_LOG_CSV, index=False)
-    logger.info("Successfully wrote CSV file: %s", TRADE_LOG_CSV)
+    _append_trade_log(log)
 
 
     if total_shares == shares_sold:
-        chatgpt_portfolio = chatgpt_portfolio[chatgpt_portfolio["ticker"] != ticker]
+        chatgpt_portfolio = chatgpt_portfolio[~held_mask]
     else:
         row_index = ticker_row.index[0]
         chatgpt_portfolio.at[row_index, "shares"] = total_shares - shares_sold
@@ -910,9 +957,28 @@ If this is a mistake, enter 1, or hit Enter."""
 # Reporting / Metrics
 # ------------------------------
 
+# Column widths 10/12/9/15, baked into one format string instead of nested f-string specs per cell
+_PRICE_ROW_FMT = "{:<10} {:>12} {:>9} {:>15}"
+
+
+def _price_table_lines(header: list[str], rows: list[list[str]]) -> list[str]:
+    """Return the Price & Volume table lines shared by every daily_results exit path."""
+    lines = ["\n[ Price & Volume ]", _PRICE_ROW_FMT.format(*header), "-" * 49]
+    lines.extend(_PRICE_ROW_FMT.format(*map(str, row)) for row in rows)
+    return lines
+
+
+def _date_label(value: object) -> str:
+    """Render a drawdown date as YYYY-MM-DD, falling back to str() for anything else."""
+    if hasattr(value, "date") and not isinstance(value, (str, int)):
+        return str(value.date())
+    if hasattr(value, "strftime") and not isinstance(value, (str, int)):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
 def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
     """Print daily price updates and performance metrics (incl. CAPM)."""
-    portfolio_dict: list[dict[Any, Any]] = chatgpt_portfolio.to_dict(orient="records")
     today = check_weekend()
 
     rows: list[list[str]] = []
@@ -920,14 +986,15 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
 
     end_d = last_trading_date()                           # Fri on weekends
     start_d = (end_d - pd.Timedelta(days=4)).normalize()  # go back enough to capture 2 sessions even around holidays
-    
+    stop_d = end_d + pd.Timedelta(days=1)
+
+    # Only the ticker column is needed; skip materializing every holding as a dict
+    held = chatgpt_portfolio["ticker"].astype(str).str.upper().tolist() if "ticker" in chatgpt_portfolio else []
     benchmarks = load_benchmarks()  # reads tickers.json or returns defaults
-    benchmark_entries = [{"ticker": t} for t in benchmarks]
 
-    for stock in portfolio_dict + benchmark_entries:
-        ticker = str(stock["ticker"]).upper()
+    for ticker in held + benchmarks:
         try:
-            fetch = download_price_data(ticker, start=start_d, end=(end_d + pd.Timedelta(days=1)), progress=False)
+            fetch = download_price_data(ticker, start=start_d, end=stop_d, progress=False)
             data = fetch.df
             if data.empty or len(data) < 2:
                 rows.append([ticker, "—", "—", "—"])
@@ -943,63 +1010,44 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
             raise Exception(f"Download for {ticker} failed. {e} Try checking internet connection.")
 
     # Read portfolio history
-    logger.info("Reading CSV file: %s", PORTFOLIO_CSV)
-    chatgpt_df = pd.read_csv(PORTFOLIO_CSV)
-    logger.info("Successfully read CSV file: %s", PORTFOLIO_CSV)
+    chatgpt_df = _read_csv_cached(PORTFOLIO_CSV)
 
     # Use only TOTAL rows, sorted by date
     totals = chatgpt_df[chatgpt_df["Ticker"] == "TOTAL"].copy()
+    # The report is collected into lines and written with a single print
+    lines = ["\n" + "=" * 64, f"Daily Results — {today}", "=" * 64]
+    lines += _price_table_lines(header, rows)
+
     if totals.empty:
-        print("\n" + "=" * 64)
-        print(f"Daily Results — {today}")
-        print("=" * 64)
-        print("\n[ Price & Volume ]")
-        colw = [10, 12, 9, 15]
-        print(f"{header[0]:<{colw[0]}} {header[1]:>{colw[1]}} {header[2]:>{colw[2]}} {header[3]:>{colw[3]}}")
-        print("-" * sum(colw) + "-" * 3)
-        for r in rows:
-            print(f"{str(r[0]):<{colw[0]}} {str(r[1]):>{colw[1]}} {str(r[2]):>{colw[2]}} {str(r[3]):>{colw[3]}}")
-        print("\n[ Portfolio Snapshot ]")
-        print(chatgpt_portfolio)
-        print(f"Cash balance: ${cash:,.2f}")
+        lines += ["\n[ Portfolio Snapshot ]", str(chatgpt_portfolio), f"Cash balance: ${cash:,.2f}"]
+        print("\n".join(lines))
         return
 
     totals["Date"] = pd.to_datetime(totals["Date"], format="mixed", errors="coerce")  # tolerate ISO strings
-    totals = totals.sort_values("Date")
 
-    final_equity = float(totals.iloc[-1]["Total Equity"])
+    # Sort once; drawdown, returns and CAPM below all read this date-ordered series
     equity_series = totals.set_index("Date")["Total Equity"].astype(float).sort_index()
+    final_equity = float(equity_series.iloc[-1])
 
     # --- Max Drawdown ---
-    running_max = equity_series.cummax()
-    drawdowns = (equity_series / running_max) - 1.0
-    max_drawdown = float(drawdowns.min())  # most negative value
-    mdd_date = drawdowns.idxmin()
+    equity = equity_series.to_numpy()
+    drawdowns = equity / np.fmax.accumulate(equity) - 1.0  # fmax skips NaN like cummax
+    mdd_idx = int(np.nanargmin(drawdowns))
+    max_drawdown = float(drawdowns[mdd_idx])  # most negative value
+    mdd_date = equity_series.index[mdd_idx]
 
     # Daily simple returns (portfolio)
     r = equity_series.pct_change().dropna()
     n_days = len(r)
     if n_days < 2:
-        print("\n" + "=" * 64)
-        print(f"Daily Results — {today}")
-        print("=" * 64)
-        print("\n[ Price & Volume ]")
-        colw = [10, 12, 9, 15]
-        print(f"{header[0]:<{colw[0]}} {header[1]:>{colw[1]}} {header[2]:>{colw[2]}} {header[3]:>{colw[3]}}")
-        print("-" * sum(colw) + "-" * 3)
-        for rrow in rows:
-            print(f"{str(rrow[0]):<{colw[0]}} {str(rrow[1]):>{colw[1]}} {str(rrow[2]):>{colw[2]}} {str(rrow[3]):>{colw[3]}}")
-        print("\n[ Portfolio Snapshot ]")
-        print(chatgpt_portfolio)
-        print(f"Cash balance: ${cash:,.2f}")
-        print(f"Latest ChatGPT Equity: ${final_equity:,.2f}")
-        if hasattr(mdd_date, "date") and not isinstance(mdd_date, (str, int)):
-            mdd_date_str = mdd_date.date()
-        elif hasattr(mdd_date, "strftime") and not isinstance(mdd_date, (str, int)):
-            mdd_date_str = mdd_date.strftime("%Y-%m-%d")
-        else:
-            mdd_date_str = str(mdd_date)
-        print(f"Maximum Drawdown: {max_drawdown:.2%} (on {mdd_date_str})")
+        lines += [
+            "\n[ Portfolio Snapshot ]",
+            str(chatgpt_portfolio),
+            f"Cash balance: ${cash:,.2f}",
+            f"Latest ChatGPT Equity: ${final_equity:,.2f}",
+        ]
+        lines.append(f"Maximum Drawdown: {max_drawdown:.2%} (on {_date_label(mdd_date)})")
+        print("\n".join(lines))
         return
 
     # Risk-free config
@@ -1007,25 +1055,18 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
     rf_daily = (1 + rf_annual) ** (1 / 252) - 1
     rf_period = (1 + rf_daily) ** n_days - 1
 
-    # Stats
-    mean_daily = float(r.mean())
-    std_daily = float(r.std(ddof=1))
+    # Stats (all reductions run on one float array)
+    returns = r.to_numpy(dtype=float)
+    mean_daily = float(returns.mean())
+    std_daily = float(returns.std(ddof=1))
 
     # Downside deviation (MAR = rf_daily)
-    downside = (r - rf_daily).clip(upper=0)
-    downside_std = float((downside.pow(2).mean()) ** 0.5) if not downside.empty else np.nan
-
-    # Total return over the window
-    r_numeric = pd.to_numeric(r, errors="coerce")
-    r_numeric = r_numeric[~r_numeric.isna()].astype(float)
-    # Filter out any non-finite values to ensure only valid floats are used
-    r_numeric = r_numeric[np.isfinite(r_numeric)]
-    # Only use numeric values for the calculation
-    if len(r_numeric) > 0:
-        arr = np.asarray(r_numeric.values, dtype=float)
-        period_return = float(np.prod(1 + arr) - 1) if arr.size > 0 else float('nan')
-    else:
-        period_return = float('nan')
+    shortfall = np.minimum(returns - rf_daily, 0.0)
+    downside_std = float(np.sqrt(np.mean(shortfall * shortfall)))
+
+    # Total return over the window, skipping non-finite returns
+    finite = returns[np.isfinite(returns)]
+    period_return = float(np.prod(1.0 + finite) - 1.0) if finite.size else float("nan")
 
     # Sharpe / Sortino
     sharpe_period = (period_return - rf_period) / (std_daily * np.sqrt(n_days)) if std_daily > 0 else np.nan
@@ -1039,14 +1080,15 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
 
     spx_fetch = download_price_data("^GSPC", start=start_date, end=end_date, progress=False)
     spx = spx_fetch.df
+    if not spx.empty:
+        spx = spx.reset_index().set_index("Date").sort_index()
 
     beta = np.nan
     alpha_annual = np.nan
     r2 = np.nan
     n_obs = 0
 
-    if not spx.empty and len(spx) >= 2:
-        spx = spx.reset_index().set_index("Date").sort_index()
+    if len(spx) >= 2:
         mkt_ret = spx["Close"].astype(float).pct_change().dropna()
 
         # Align portfolio & market returns
@@ -1067,14 +1109,9 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
                 corr = np.corrcoef(x, y)[0, 1]
                 r2 = float(corr ** 2)
 
-    # $X normalized S&P 500 over same window (asks user for initial equity)
-    spx_norm_fetch = download_price_data(
-        "^GSPC",
-        start=equity_series.index.min(),
-        end=equity_series.index.max() + pd.Timedelta(days=1),
-        progress=False,
-    )
-    spx_norm = spx_norm_fetch.df
+    # $X normalized S&P 500 over same window (asks user for initial equity).
+    # The CAPM fetch above starts one day earlier, so slice it instead of re-downloading.
+    spx_norm = spx.loc[equity_series.index.min():]
     spx_value = np.nan
     starting_equity = np.nan  # Ensure starting_equity is always defined
     if not spx_norm.empty:
@@ -1087,59 +1124,41 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
         spx_value = (starting_equity / initial_price) * price_now if not np.isnan(starting_equity) else np.nan
 
     # -------- Pretty Printing --------
-    print("\n" + "=" * 64)
-    print(f"Daily Results — {today}")
-    print("=" * 64)
-
-    # Price & Volume table
-    print("\n[ Price & Volume ]")
-    colw = [10, 12, 9, 15]
-    print(f"{header[0]:<{colw[0]}} {header[1]:>{colw[1]}} {header[2]:>{colw[2]}} {header[3]:>{colw[3]}}")
-    print("-" * sum(colw) + "-" * 3)
-    for rrow in rows:
-        print(f"{str(rrow[0]):<{colw[0]}} {str(rrow[1]):>{colw[1]}} {str(rrow[2]):>{colw[2]}} {str(rrow[3]):>{colw[3]}}")
-
     # Performance metrics
     def fmt_or_na(x: float | int | None, fmt: str) -> str:
         return (fmt.format(x) if not (x is None or (isinstance(x, float) and np.isnan(x))) else "N/A")
 
-    print("\n[ Risk & Return ]")
-    if hasattr(mdd_date, "date") and not isinstance(mdd_date, (str, int)):
-        mdd_date_str = mdd_date.date()
-    elif hasattr(mdd_date, "strftime") and not isinstance(mdd_date, (str, int)):
-        mdd_date_str = mdd_date.strftime("%Y-%m-%d")
-    else:
-        mdd_date_str = str(mdd_date)
-    print(f"{'Max Drawdown:':32} {fmt_or_na(max_drawdown, '{:.2%}'):>15}   on {mdd_date_str}")
-    print(f"{'Sharpe Ratio (period):':32} {fmt_or_na(sharpe_period, '{:.4f}'):>15}")
-    print(f"{'Sharpe Ratio (annualized):':32} {fmt_or_na(sharpe_annual, '{:.4f}'):>15}")
-    print(f"{'Sortino Ratio (period):':32} {fmt_or_na(sortino_period, '{:.4f}'):>15}")
-    print(f"{'Sortino Ratio (annualized):':32} {fmt_or_na(sortino_annual, '{:.4f}'):>15}")
-
-    print("\n[ CAPM vs Benchmarks ]")
+    lines.append("\n[ Risk & Return ]")
+    lines.append(f"{'Max Drawdown:':32} {fmt_or_na(max_drawdown, '{:.2%}'):>15}   on {_date_label(mdd_date)}")
+    lines.append(f"{'Sharpe Ratio (period):':32} {fmt_or_na(sharpe_period, '{:.4f}'):>15}")
+    lines.append(f"{'Sharpe Ratio (annualized):':32} {fmt_or_na(sharpe_annual, '{:.4f}'):>15}")
+    lines.append(f"{'Sortino Ratio (period):':32} {fmt_or_na(sortino_period, '{:.4f}'):>15}")
+    lines.append(f"{'Sortino Ratio (annualized):':32} {fmt_or_na(sortino_annual, '{:.4f}'):>15}")
+
+    lines.append("\n[ CAPM vs Benchmarks ]")
     if not np.isnan(beta):
-        print(f"{'Beta (daily) vs ^GSPC:':32} {beta:>15.4f}")
-        print(f"{'Alpha (annualized) vs ^GSPC:':32} {alpha_annual:>15.2%}")
-        print(f"{'R² (fit quality):':32} {r2:>15.3f}   {'Obs:':>6} {n_obs}")
+        lines.append(f"{'Beta (daily) vs ^GSPC:':32} {beta:>15.4f}")
+        lines.append(f"{'Alpha (annualized) vs ^GSPC:':32} {alpha_annual:>15.2%}")
+        lines.append(f"{'R² (fit quality):':32} {r2:>15.3f}   {'Obs:':>6} {n_obs}")
         if n_obs < 60 or (not np.isnan(r2) and r2 < 0.20):
-            print("  Note: Short sample and/or low R² — alpha/beta may be unstable.")
+            lines.append("  Note: Short sample and/or low R² — alpha/beta may be unstable.")
     else:
-        print("Beta/Alpha: insufficient overlapping data.")
+        lines.append("Beta/Alpha: insufficient overlapping data.")
 
-    print("\n[ Snapshot ]")
-    print(f"{'Latest ChatGPT Equity:':32} ${final_equity:>14,.2f}")
+    lines.append("\n[ Snapshot ]")
+    lines.append(f"{'Latest ChatGPT Equity:':32} ${final_equity:>14,.2f}")
     if not np.isnan(spx_value):
         try:
-            print(f"{f'${starting_equity} in S&P 500 (same window):':32} ${spx_value:>14,.2f}")
+            lines.append(f"{f'${starting_equity} in S&P 500 (same window):':32} ${spx_value:>14,.2f}")
         except Exception:
             pass
-    print(f"{'Cash Balance:':32} ${cash:>14,.2f}")
+    lines.append(f"{'Cash Balance:':32} ${cash:>14,.2f}")
 
-    print("\n[ Holdings ]")
-    print(chatgpt_portfolio)
+    lines.append("\n[ Holdings ]")
+    lines.append(str(chatgpt_portfolio))
 
-    print("\n[ Your Instructions ]")
-    print(
+    lines.append("\n[ Your Instructions ]")
+    lines.append(
         "Use this info to make decisions regarding your portfolio. You have complete control over every decision. Make any changes you believe are beneficial—no approval required.\n"
         "Deep research is not permitted. Act at your discretion to achieve the best outcome.\n"
         "If you do not make a clear indication to change positions IMMEDIATELY after this message, the portfolio remains unchanged for tomorrow.\n"
@@ -1147,17 +1166,17 @@ def daily_results(chatgpt_portfolio: pd.DataFrame, cash: float) -> None:
         "\n"
         "*Paste everything above into ChatGPT*"
     )
+    print("\n".join(lines))
 
 
 # ------------------------------
 # Orchestration
 # ------------------------------
 
-def load_latest_portfolio_state() -> tuple[pd.DataFrame | list[dict[str, Any]], float]:
+def load_latest_portfolio_state() -> tuple[pd.DataFrame, float]:
     """Load the most recent portfolio snapshot and cash balance from global PORTFOLIO_CSV."""
-    logger.info("Reading CSV file: %s", PORTFOLIO_CSV)
     try:
-        df = pd.read_csv(PORTFOLIO_CSV)
+        df = _read_csv_cached(PORTFOLIO_CSV)
     except FileNotFoundError as e:
         raise FileNotFoundError(
         f"Could not find portfolio CSV at {PORTFOLIO_CSV}.\n"
@@ -1167,9 +1186,8 @@ def load_latest_portfolio_state() -> tuple[pd.DataFrame | list[dict[str, Any]],
         "  2) Run: python trading_script.py --data-dir 'Start Your Own'"
     ) from e
 
-    logger.info("Successfully read CSV file: %s", PORTFOLIO_CSV)
     if df.empty:
-        portfolio = pd.DataFrame(columns=["ticker", "shares", "stop_loss", "buy_price", "cost_basis"])
+        portfolio = pd.DataFrame(columns=PORTFOLIO_COLUMNS)
         print("Portfolio CSV is empty. Returning set amount of cash for creating portfolio.")
         try:
             cash = float(input("What would you like your starting cash amount to be? "))
@@ -1179,14 +1197,17 @@ def load_latest_portfolio_state() -> tuple[pd.DataFrame | list[dict[str, Any]],
             )
         return portfolio, cash
 
-    non_total = df[df["Ticker"] != "TOTAL"].copy()
-    non_total["Date"] = pd.to_datetime(non_total["Date"], format="mixed", errors="coerce")
+    # Parse dates once on the whole frame (already our own copy), then split
+    # holdings and TOTAL rows with a single comparison
+    df["Date"] = pd.to_datetime(df["Date"], format="mixed", errors="coerce")
+    total_mask = (df["Ticker"] == "TOTAL").to_numpy()
+    non_total = df[~total_mask]
 
-    latest_date = non_total["Date"].max()
-    latest_tickers = non_total[non_total["Date"] == latest_date].copy()
+    latest_tickers = non_total[non_total["Date"] == non_total["Date"].max()]
     sold_mask = latest_tickers["Action"].astype(str).str.startswith("SELL")
-    latest_tickers = latest_tickers[~sold_mask].copy()
-    latest_tickers.drop(
+    # Drop the report columns rather than selecting holdings ones, so the
+    # holdings keep the CSV's column order
+    latest_tickers = latest_tickers.loc[~sold_mask].drop(
         columns=[
             "Date",
             "Cash Balance",
@@ -1196,24 +1217,20 @@ def load_latest_portfolio_state() -> tuple[pd.DataFrame | list[dict[str, Any]],
             "PnL",
             "Total Value",
         ],
-        inplace=True,
         errors="ignore",
-    )
-    latest_tickers.rename(
+    ).rename(
         columns={
             "Cost Basis": "cost_basis",
             "Buy Price": "buy_price",
             "Shares": "shares",
             "Ticker": "ticker",
             "Stop Loss": "stop_loss",
-        },
-        inplace=True,
+        }
     )
-    latest_tickers = latest_tickers.reset_index(drop=True).to_dict(orient="records")
+    latest_tickers = latest_tickers.reset_index(drop=True)
 
-    df_total = df[df["Ticker"] == "TOTAL"].copy()
-    df_total["Date"] = pd.to_datetime(df_total["Date"], format="mixed", errors="coerce")
-    latest = df_total.sort_values("Date").iloc[-1]
+    df_total = df[total_mask]
+    latest = df_total.loc[df_total["Date"].idxmax()]
     cash = float(latest["Cash Balance"])
     return latest_tickers, cash
 